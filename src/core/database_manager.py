@@ -1,9 +1,17 @@
 import sqlite3
 import os
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+def _parse_timestamps(values: pd.Series) -> pd.Series:
+    # Rows are written with datetime.isoformat(), which drops the fraction on
+    # whole seconds, so parse as ISO 8601 rather than a fixed strftime format.
+    # Caching pays off because each sampling tick shares one timestamp.
+    return pd.to_datetime(values, format='ISO8601', cache=True)
+
+
 class DatabaseManager:
 
     def __init__(self, db_path: str = "data/taskmaster.db"):
@@ -115,36 +123,156 @@ class DatabaseManager:
 
             df = pd.read_sql_query(query, self.conn, params=params)
 
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            df['timestamp'] = _parse_timestamps(df['timestamp'])
 
             return df
         except (sqlite3.Error, pd.errors.DatabaseError) as e:
             print(f"Error retrieving process history: {e}")
             return pd.DataFrame()
 
-    def get_system_history(self, hours: int = 24) -> pd.DataFrame:
+    def get_system_history(self, hours: int = 24, max_rows: Optional[int] = None) -> pd.DataFrame:
         if not self.conn:
             self.initialize_database()
 
         try:
             time_limit = (datetime.now() - pd.Timedelta(hours=hours)).isoformat()
 
-            query = """
-            SELECT * FROM system_history
-            WHERE timestamp > ?
-            ORDER BY timestamp
-            """
+            stride = 1
+            if max_rows:
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    "SELECT COUNT(*) FROM system_history WHERE timestamp > ?",
+                    [time_limit]
+                )
+                total = cursor.fetchone()[0]
+                stride = max(1, -(-total // max_rows))
+
+            if stride > 1:
+                # Keep every stride-th row so at most max_rows leave SQLite,
+                # counting back from the newest so the latest sample is always kept
+                query = """
+                SELECT id, timestamp, cpu_percent, memory_percent, disk_percent, total_processes
+                FROM (
+                    SELECT *,
+                           ROW_NUMBER() OVER (ORDER BY timestamp) AS rn,
+                           COUNT(*) OVER () AS total
+                    FROM system_history
+                    WHERE timestamp > ?
+                )
+                WHERE (total - rn) % ? = 0
+                ORDER BY timestamp
+                """
+                params = [time_limit, stride]
+            else:
+                query = """
+                SELECT * FROM system_history
+                WHERE timestamp > ?
+                ORDER BY timestamp
+                """
+                params = [time_limit]
 
-            df = pd.read_sql_query(query, self.conn, params=[time_limit])
+            df = pd.read_sql_query(query, self.conn, params=params)
+
+            df['timestamp'] = _parse_timestamps(df['timestamp'])
 
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            # Telemetry doesn't need float64 precision; halve the bytes per sample
+            df = df.astype({
+                'cpu_percent': 'float32',
+                'memory_percent': 'float32',
+                'disk_percent': 'float32',
+                # float32 rather than int32 so NULL counts survive as NaN
+                'total_processes': 'float32'
+            })
 
             return df
         except (sqlite3.Error, pd.errors.DatabaseError) as e:
             print(f"Error retrieving system history: {e}")
             return pd.DataFrame()
 
-    def get_top_processes_by_cpu(self, limit: int = 5) -> pd.DataFrame:
+    def get_latest_system_id(self) -> Optional[int]:
+        if not self.conn:
+            self.initialize_database()
+
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT MAX(id) FROM system_history")
+            return cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"Error retrieving latest system id: {e}")
+            return None
+
+    def get_system_summary_sql(self, hours: int = 24) -> Optional[Dict[str, Any]]:
+        if not self.conn:
+            self.initialize_database()
+
+        try:
+            time_limit = (datetime.now() - pd.Timedelta(hours=hours)).isoformat()
+
+            cursor = self.conn.cursor()
+            cursor.execute("""
+            SELECT AVG(cpu_percent), MAX(cpu_percent),
+                   AVG(memory_percent), MAX(memory_percent),
+                   AVG(disk_percent), MAX(disk_percent),
+                   AVG(total_processes),
+                   MIN(timestamp), MAX(timestamp),
+                   COUNT(*)
+            FROM system_history
+            WHERE timestamp > ?
+            """, [time_limit])
+
+            row = cursor.fetchone()
+
+            if row is None or row[9] == 0:
+                return None
+
+            return {
+                'cpu_avg': row[0],
+                'cpu_max': row[1],
+                'memory_avg': row[2],
+                'memory_max': row[3],
+                'disk_avg': row[4],
+                'disk_max': row[5],
+                'processes_avg': row[6],
+                # Stored with datetime.isoformat(), so no format inference is needed
+                'start_time': pd.Timestamp.fromisoformat(row[7]),
+                'end_time': pd.Timestamp.fromisoformat(row[8]),
+                'data_points': row[9]
+            }
+        except sqlite3.Error as e:
+            print(f"Error retrieving system summary: {e}")
+            return None
+
+    def get_process_summary_sql(self, process_name: str) -> Optional[Dict[str, Any]]:
+        if not self.conn:
+            self.initialize_database()
+
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+            SELECT AVG(cpu_percent), MAX(cpu_percent),
+                   AVG(memory_mb), MAX(memory_mb),
+                   COUNT(*)
+            FROM process_history
+            WHERE name = ?
+            """, [process_name])
+
+            row = cursor.fetchone()
+
+            if row is None or row[4] == 0:
+                return None
+
+            return {
+                'cpu_avg': row[0],
+                'cpu_max': row[1],
+                'memory_avg': row[2],
+                'memory_max': row[3],
+                'data_points': row[4]
+            }
+        except sqlite3.Error as e:
+            print(f"Error retrieving process summary: {e}")
+            return None
+
+    def get_top_processes_by_cpu(self, limit: int = 5) -> Dict[str, np.ndarray]:
         if not self.conn:
             self.initialize_database()
 
@@ -159,11 +287,22 @@ class DatabaseManager:
             LIMIT ?
             """
 
-            df = pd.read_sql_query(query, self.conn, params=[limit])
-            return df
-        except (sqlite3.Error, pd.errors.DatabaseError) as e:
+            cursor = self.conn.cursor()
+            cursor.execute(query, [limit])
+            rows = cursor.fetchall()
+        except sqlite3.Error as e:
             print(f"Error retrieving top processes: {e}")
-            return pd.DataFrame()
+            rows = []
+
+        # Column arrays are cheaper to build than a DataFrame for a handful of rows
+        names, cpu, memory, count = zip(*rows) if rows else ((), (), (), ())
+
+        return {
+            'name': np.array(names, dtype=object),
+            'avg_cpu': np.asarray(cpu, dtype=np.float32),
+            'avg_memory': np.asarray(memory, dtype=np.float32),
+            'count': np.asarray(count, dtype=np.int32)
+        }
 
     def get_process_trend(self, process_name: str) -> pd.DataFrame:
         if not self.conn:
@@ -179,7 +318,7 @@ class DatabaseManager:
 
             df = pd.read_sql_query(query, self.conn, params=[process_name])
 
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            df['timestamp'] = _parse_timestamps(df['timestamp'])
 
             if not df.empty:
                 df = df.set_index('timestamp')
@@ -1,18 +1,72 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Tuple
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
+# matplotlib is slow to import and only needed by the chart helpers, so it is
+# imported where it is used
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+DEFAULT_CHART_POINTS = 2000
+
+# Rows fetched per plotted point, leaving LTTB enough samples to keep peaks
+HISTORY_OVERSAMPLING = 4
+
+
+def _downsample_lttb(timestamps: np.ndarray, values: np.ndarray,
+                     threshold: int = DEFAULT_CHART_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduce a series to `threshold` points with Largest-Triangle-Three-Buckets."""
+    n = len(values)
+    if threshold < 3 or n <= threshold:
+        return timestamps, values
+
+    finite = np.isfinite(values)
+    if not finite.all():
+        timestamps, values = timestamps[finite], values[finite]
+        n = len(values)
+        if n <= threshold:
+            return timestamps, values
+
+    # datetime64 values are ranked by their integer nanosecond offsets
+    xs = timestamps.view(np.int64) if timestamps.dtype.kind == 'M' else timestamps
+    xs = xs.astype(np.float64)
+    ys = values.astype(np.float64)
+
+    every = (n - 2) / (threshold - 2)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    a = 0
+
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = xs[avg_start:avg_end].mean()
+        avg_y = ys[avg_start:avg_end].mean()
+
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+
+        areas = np.abs((xs[a] - avg_x) * (ys[range_start:range_end] - ys[a])
+                       - (xs[a] - xs[range_start:range_end]) * (avg_y - ys[a]))
+        a = range_start + int(areas.argmax())
+        indices[i + 1] = a
+
+    indices[-1] = n - 1
+
+    return timestamps[indices], values[indices]
+
+
 class HistoryAnalyzer:
 
     def __init__(self, database_manager):
         self.db_manager = database_manager
 
     def get_system_summary(self, hours: int = 24) -> Dict[str, Any]:
-        df = self.db_manager.get_system_history(hours)
+        summary = self.db_manager.get_system_summary_sql(hours)
 
-        if df.empty:
+        if summary is None:
             return {
                 'cpu_avg': 0.0,
                 'cpu_max': 0.0,
@@ -26,107 +80,90 @@ class HistoryAnalyzer:
                 'data_points': 0
             }
 
-        summary = {
-            'cpu_avg': df['cpu_percent'].mean(),
-            'cpu_max': df['cpu_percent'].max(),
-            'memory_avg': df['memory_percent'].mean(),
-            'memory_max': df['memory_percent'].max(),
-            'disk_avg': df['disk_percent'].mean(),
-            'disk_max': df['disk_percent'].max(),
-            'processes_avg': int(df['total_processes'].mean()),
-            'start_time': df['timestamp'].min(),
-            'end_time': df['timestamp'].max(),
-            'data_points': len(df)
-        }
+        # A metric with no non-NULL samples comes back as None; show it as 0
+        # like an empty window
+        for key in ('cpu_avg', 'cpu_max', 'memory_avg', 'memory_max',
+                    'disk_avg', 'disk_max', 'processes_avg'):
+            if summary[key] is None:
+                summary[key] = 0.0
+
+        summary['processes_avg'] = int(summary['processes_avg'])
 
         return summary
 
-    def get_top_processes(self, limit: int = 5) -> pd.DataFrame:
+    def build_system_bundle(self, hours: int = 24, max_points: int = DEFAULT_CHART_POINTS
+                            ) -> Tuple[Dict[str, Any], Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+        # Stats come from SQL over every row; only the plotted series are decimated
+        summary = self.get_system_summary(hours)
+
+        df = self.db_manager.get_system_history(hours, max_rows=max_points * HISTORY_OVERSAMPLING)
+        cpu_series = self.get_series(df, 'cpu_percent', max_points)
+        mem_series = self.get_series(df, 'memory_percent', max_points)
+
+        return summary, cpu_series, mem_series
+
+    def get_series(self, df: pd.DataFrame, column: str,
+                   max_points: int = DEFAULT_CHART_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+        if df.empty:
+            return np.empty(0, dtype='datetime64[ns]'), np.empty(0, dtype=np.float32)
+
+        return _downsample_lttb(df['timestamp'].values, df[column].values, max_points)
+
+    def get_process_trend_series(self, process_name: str, max_points: int = DEFAULT_CHART_POINTS
+                                 ) -> Tuple[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+        df = self.db_manager.get_process_trend(process_name)
+
+        return self.get_series(df, 'cpu_percent', max_points), self.get_series(df, 'memory_mb', max_points)
+
+    def get_top_processes(self, limit: int = 5) -> Dict[str, np.ndarray]:
         return self.db_manager.get_top_processes_by_cpu(limit)
 
     def get_process_analysis(self, process_name: str) -> Dict[str, Any]:
-        df = self.db_manager.get_process_trend(process_name)
+        analysis = self.db_manager.get_process_summary_sql(process_name)
 
-        if df.empty:
+        if analysis is None:
             return {
                 'name': process_name,
                 'cpu_avg': 0.0,
                 'cpu_max': 0.0,
                 'memory_avg': 0.0,
                 'memory_max': 0.0,
-                'data_points': 0,
-                'trend_data': pd.DataFrame()
+                'data_points': 0
             }
 
-        analysis = {
-            'name': process_name,
-            'cpu_avg': df['cpu_percent'].mean(),
-            'cpu_max': df['cpu_percent'].max(),
-            'memory_avg': df['memory_mb'].mean(),
-            'memory_max': df['memory_mb'].max(),
-            'data_points': len(df),
-            'trend_data': df
-        }
-
-        return analysis
-
-    def generate_cpu_usage_chart(self, hours: int = 24) -> plt.Figure:
-        df = self.db_manager.get_system_history(hours)
+        # AVG/MAX are NULL when every sample of the process is NULL
+        for key in ('cpu_avg', 'cpu_max', 'memory_avg', 'memory_max'):
+            if analysis[key] is None:
+                analysis[key] = 0.0
 
-        if df.empty:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.text(0.5, 0.5, "No data available", ha='center', va='center')
-            return fig
-
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        ax.plot(df['timestamp'], df['cpu_percent'], 'b-', linewidth=2)
-
-        ax.set_xlabel('Time')
-        ax.set_ylabel('CPU Usage (%)')
-        ax.set_title(f'CPU Usage Over the Last {hours} Hours')
-
-        ax.grid(True, alpha=0.3)
-
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-
-        return fig
-
-    def generate_memory_usage_chart(self, hours: int = 24) -> plt.Figure:
-        df = self.db_manager.get_system_history(hours)
-
-        if df.empty:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.text(0.5, 0.5, "No data available", ha='center', va='center')
-            return fig
-
-        fig, ax = plt.subplots(figsize=(10, 6))
+        analysis['name'] = process_name
 
-        ax.plot(df['timestamp'], df['memory_percent'], 'r-', linewidth=2)
+        return analysis
 
-        ax.set_xlabel('Time')
-        ax.set_ylabel('Memory Usage (%)')
-        ax.set_title(f'Memory Usage Over the Last {hours} Hours')
+    def _prepare_axes(self, ax: Optional['Axes'] = None) -> 'Axes':
+        if ax is None:
+            from matplotlib.figure import Figure
 
-        ax.grid(True, alpha=0.3)
+            fig = Figure(figsize=(10, 6))
+            return fig.subplots()
 
-        plt.xticks(rotation=45)
-        plt.tight_layout()
+        ax.clear()
+        return ax
 
-        return fig
+    def generate_top_processes_chart(self, limit: int = 5, ax: Optional['Axes'] = None,
+                                     top: Optional[Dict[str, np.ndarray]] = None) -> 'Figure':
+        if top is None:
+            top = self.get_top_processes(limit)
 
-    def generate_top_processes_chart(self, limit: int = 5) -> plt.Figure:
-        df = self.get_top_processes(limit)
+        owns_figure = ax is None
+        ax = self._prepare_axes(ax)
+        fig = ax.figure
 
-        if df.empty:
-            fig, ax = plt.subplots(figsize=(10, 6))
+        if len(top['name']) == 0:
             ax.text(0.5, 0.5, "No data available", ha='center', va='center')
             return fig
 
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        bars = ax.bar(df['name'], df['avg_cpu'], color='skyblue')
+        bars = ax.bar(top['name'], top['avg_cpu'], color='skyblue')
 
         ax.set_xlabel('Process Name')
         ax.set_ylabel('Average CPU Usage (%)')
@@ -137,38 +174,15 @@ class HistoryAnalyzer:
             ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
                     f'{height:.1f}%', ha='center', va='bottom')
 
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-
-        return fig
-
-    def generate_process_trend_chart(self, process_name: str) -> plt.Figure:
-        df = self.db_manager.get_process_trend(process_name)
-
-        if df.empty:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.text(0.5, 0.5, f"No data available for {process_name}", ha='center', va='center')
-            return fig
-
-        fig, ax1 = plt.subplots(figsize=(10, 6))
-        ax2 = ax1.twinx()
-
-        ax1.plot(df['timestamp'], df['cpu_percent'], 'b-', linewidth=2, label='CPU Usage')
-        ax1.set_xlabel('Time')
-        ax1.set_ylabel('CPU Usage (%)', color='b')
-        ax1.tick_params(axis='y', labelcolor='b')
-
-        ax2.plot(df['timestamp'], df['memory_mb'], 'r-', linewidth=2, label='Memory Usage')
-        ax2.set_ylabel('Memory Usage (MB)', color='r')
-        ax2.tick_params(axis='y', labelcolor='r')
-
-        plt.title(f'CPU and Memory Trends for {process_name}')
+        # Leave headroom above the tallest bar for its value label
+        ax.margins(y=0.15)
 
-        lines1, labels1 = ax1.get_legend_handles_labels()
-        lines2, labels2 = ax2.get_legend_handles_labels()
-        ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
+        ax.tick_params(axis='x', labelrotation=45)
+        for label in ax.get_xticklabels():
+            label.set_horizontalalignment('right')
 
-        plt.xticks(rotation=45)
-        plt.tight_layout()
+        # A caller-owned figure keeps its own layout engine, which tight_layout() would replace
+        if owns_figure:
+            fig.tight_layout()
 
         return fig
@@ -2,14 +2,15 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QSizePolicy
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import Qt, QPointF, QRectF
+from PyQt6.QtGui import QFont, QColor, QFontMetrics, QPainter, QPen, QPolygonF
 
 import matplotlib
 matplotlib.use('QtAgg')
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from collections import deque
+import numpy as np
 import time
 
 plt_style = {
@@ -162,3 +163,187 @@ class ChartsWidget(QWidget):
             self.disk_graph.update_data(system_monitor.disk_percent)
         except Exception as e:
             print(f"Error updating charts: {e}")
+
+
+class FastLineChart(QWidget):
+
+    MARGIN_LEFT = 55
+    MARGIN_RIGHT = 15
+    MARGIN_TOP = 25
+    MARGIN_BOTTOM = 30
+    Y_TICKS = 5
+
+    def __init__(self, color='#4287f5', secondary_color='#f54242', parent=None):
+        super().__init__(parent)
+
+        self.color = color
+        self.secondary_color = secondary_color
+
+        self.title = ''
+        self.ylabel = ''
+        self.secondary_label = ''
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self.secondary = None
+        self.x_dtype = None
+
+        self.setMinimumSize(200, 150)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+    def set_data(self, x, y, title='', ylabel='', secondary=None, secondary_label=''):
+        x = np.asarray(x)
+        self.x_dtype = x.dtype if x.dtype.kind == 'M' else None
+        self.x = self._to_float(x)
+        self.y = np.asarray(y, dtype=np.float64)
+
+        if secondary is not None:
+            x2, y2 = secondary
+            secondary = (self._to_float(np.asarray(x2)), np.asarray(y2, dtype=np.float64))
+        self.secondary = secondary
+
+        self.title = title
+        self.ylabel = ylabel
+        self.secondary_label = secondary_label
+
+        self.update()
+
+    @staticmethod
+    def _to_float(x):
+        if x.dtype.kind == 'M':
+            x = x.view(np.int64)
+        return x.astype(np.float64)
+
+    @staticmethod
+    def _value_range(y):
+        finite = y[np.isfinite(y)]
+        if len(finite) == 0:
+            return 0.0, 1.0, 0.2
+
+        low = min(0.0, float(finite.min()))
+        high = float(finite.max())
+        if high <= low:
+            high = low + 1.0
+
+        # Round the axis out to a 1/2/2.5/5 x 10^k step so ticks land on round values
+        raw_step = (high - low) / FastLineChart.Y_TICKS
+        magnitude = 10 ** np.floor(np.log10(raw_step))
+        step = next(f * magnitude for f in (1, 2, 2.5, 5, 10) if f * magnitude >= raw_step)
+
+        return np.floor(low / step) * step, np.ceil(high / step) * step, step
+
+    def _format_x(self, value):
+        if self.x_dtype is None:
+            return f'{value:.0f}'
+
+        stamp = np.array([int(value)], dtype=np.int64).view(self.x_dtype)
+        return np.datetime_as_string(stamp, unit='m')[0][5:].replace('T', ' ')
+
+    def _draw_series(self, painter, plot, x, y, x_range, y_range, color):
+        if len(x) == 0:
+            return
+
+        x0, x1 = x_range
+        y0, y1, _ = y_range
+
+        px = plot.left() + (x - x0) * (plot.width() / (x1 - x0))
+        py = plot.bottom() - (y - y0) * (plot.height() / (y1 - y0))
+
+        painter.setPen(QPen(QColor(color), 1.5))
+
+        # Leave gaps where samples are missing instead of bridging them
+        valid = np.flatnonzero(np.isfinite(py))
+        for run in np.split(valid, np.flatnonzero(np.diff(valid) > 1) + 1):
+            if len(run) > 1:
+                points = [QPointF(a, b) for a, b in zip(px[run].tolist(), py[run].tolist())]
+                painter.drawPolyline(QPolygonF(points))
+            elif len(run) == 1:
+                painter.drawPoint(QPointF(px[run[0]], py[run[0]]))
+
+    @staticmethod
+    def _ticks(y_range):
+        low, high, step = y_range
+        return low + step * np.arange(int(round((high - low) / step)) + 1)
+
+    def _draw_y_axis(self, painter, plot, y_range, label, color, right=False):
+        y0, y1, _ = y_range
+        painter.setPen(QColor(color))
+
+        for value in self._ticks(y_range):
+            y = plot.bottom() - (value - y0) * (plot.height() / (y1 - y0))
+            if right:
+                rect = QRectF(plot.right() + 4, y - 8, self.MARGIN_LEFT - 8, 16)
+                align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+            else:
+                rect = QRectF(0, y - 8, plot.left() - 4, 16)
+                align = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            painter.drawText(rect, align, f'{value:g}')
+
+        # The title may run past the plot, but is elided rather than clipped at the widget edge
+        length = self.height() - 4
+        text = QFontMetrics(painter.font()).elidedText(label, Qt.TextElideMode.ElideRight, length)
+
+        painter.save()
+        if right:
+            painter.translate(self.width() - 2, self.height() / 2)
+            painter.rotate(90)
+        else:
+            painter.translate(2, self.height() / 2)
+            painter.rotate(-90)
+        painter.drawText(QRectF(-length / 2, 0, length, 12), Qt.AlignmentFlag.AlignCenter, text)
+        painter.restore()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(QFont('Arial', 8))
+        painter.fillRect(self.rect(), QColor('#2D2D30'))
+
+        right_margin = self.MARGIN_LEFT if self.secondary is not None else self.MARGIN_RIGHT
+        plot = QRectF(self.MARGIN_LEFT, self.MARGIN_TOP,
+                      self.width() - self.MARGIN_LEFT - right_margin,
+                      self.height() - self.MARGIN_TOP - self.MARGIN_BOTTOM)
+
+        painter.setPen(QColor('white'))
+        painter.drawText(QRectF(0, 0, self.width(), self.MARGIN_TOP), Qt.AlignmentFlag.AlignCenter, self.title)
+
+        if plot.width() <= 0 or plot.height() <= 0:
+            return
+
+        painter.setPen(QColor('#4F5D75'))
+        painter.drawRect(plot)
+
+        if len(self.x) == 0:
+            painter.setPen(QColor('white'))
+            painter.drawText(plot, Qt.AlignmentFlag.AlignCenter, 'No data available')
+            return
+
+        xs = [self.x] if self.secondary is None else [self.x, self.secondary[0]]
+        x0 = min(float(x.min()) for x in xs if len(x))
+        x1 = max(float(x.max()) for x in xs if len(x))
+        if x1 <= x0:
+            x1 = x0 + 1.0
+
+        y_range = self._value_range(self.y)
+
+        grid_pen = QPen(QColor('#444444'), 0.5, Qt.PenStyle.DashLine)
+        painter.setPen(grid_pen)
+        for value in self._ticks(y_range)[1:-1]:
+            y = plot.bottom() - (value - y_range[0]) * (plot.height() / (y_range[1] - y_range[0]))
+            painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+
+        self._draw_y_axis(painter, plot, y_range, self.ylabel, self.color)
+        self._draw_series(painter, plot, self.x, self.y, (x0, x1), y_range, self.color)
+
+        if self.secondary is not None:
+            x2, y2 = self.secondary
+            y2_range = self._value_range(y2)
+            self._draw_y_axis(painter, plot, y2_range, self.secondary_label, self.secondary_color, right=True)
+            self._draw_series(painter, plot, x2, y2, (x0, x1), y2_range, self.secondary_color)
+
+        painter.setPen(QColor('white'))
+        label_width = plot.width() / 3
+        for i, align in enumerate((Qt.AlignmentFlag.AlignLeft,
+                                   Qt.AlignmentFlag.AlignHCenter,
+                                   Qt.AlignmentFlag.AlignRight)):
+            rect = QRectF(plot.left() + label_width * i, plot.bottom() + 4, label_width, 16)
+            painter.drawText(rect, align | Qt.AlignmentFlag.AlignTop, self._format_x(x0 + (x1 - x0) * i / 2))
@@ -7,17 +7,125 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QTabWidget, QWidget, QComboBox,
     QTableWidget, QTableWidgetItem, QHeaderView,
-    QSplitter, QFrame
+    QSplitter, QFrame, QSizePolicy
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QSize, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QFont, QImage, QPixmap
 
-import matplotlib
-matplotlib.use('QtAgg')
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from collections import OrderedDict
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
 
+from src.core.database_manager import DatabaseManager
 from src.core.history_analyzer import HistoryAnalyzer
+from src.gui.charts_widget import FastLineChart
+
+# Delay before reloading after a selector change, so rapid changes trigger one reload
+RELOAD_DEBOUNCE_MS = 150
+
+# Number of loaded system overview periods kept for switching back without a reload
+SYSTEM_CACHE_SIZE = 16
+
+
+def _fig_to_pixmap(fig):
+    """Render a figure with the Agg backend and return it as a QPixmap."""
+    fig.canvas.draw()
+    buf, (width, height) = fig.canvas.print_to_buffer()
+    image = QImage(buf, width, height, width * 4, QImage.Format.Format_RGBA8888)
+    return QPixmap.fromImage(image)
+
+
+class ChartLabel(QLabel):
+    """Label that displays a static matplotlib chart as a pixmap.
+    
+    The chart is rendered off-screen with Agg, which avoids the event
+    handling and hit-testing that a FigureCanvasQTAgg carries for charts
+    that are never interacted with.
+    """
+    
+    def __init__(self, figsize, parent=None):
+        """Initialize the chart label.
+        
+        Args:
+            figsize: Initial figure size in inches
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        
+        self.figure = Figure(figsize=figsize, tight_layout=True)
+        FigureCanvasAgg(self.figure)
+        
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        
+        width, height = self.figure.get_size_inches() * self.figure.dpi
+        self._size_hint = QSize(int(width), int(height))
+    
+    def sizeHint(self):
+        """Return the initial figure size rather than that of the last pixmap."""
+        return self._size_hint
+    
+    def minimumSizeHint(self):
+        """Allow the label to shrink below the size of the last pixmap."""
+        return QSize(200, 150)
+    
+    def refresh(self):
+        """Re-render the figure at the label's current size."""
+        dpi = self.figure.dpi
+        self.figure.set_size_inches(self.width() / dpi, self.height() / dpi)
+        # Lay out again for the new size in case a caller swapped out the engine
+        self.figure.set_layout_engine('tight')
+        self.setPixmap(_fig_to_pixmap(self.figure))
+    
+    def resizeEvent(self, event):
+        """Re-render the chart to fit the new size."""
+        super().resizeEvent(event)
+        self.refresh()
+
+
+class SystemHistoryWorker(QRunnable):
+    """Loads the system summary and chart series off the GUI thread."""
+    
+    class Signals(QObject):
+        finished = pyqtSignal(object)
+    
+    def __init__(self, db_path, request_id, hours):
+        """Initialize the worker.
+        
+        Args:
+            db_path: Path of the history database
+            request_id: Sequence number used to discard superseded results
+            hours: Number of hours of history to load
+        """
+        super().__init__()
+        
+        self.signals = self.Signals()
+        self.db_path = db_path
+        self.request_id = request_id
+        self.hours = hours
+    
+    def run(self):
+        """Query and aggregate, then emit the results."""
+        # SQLite connections can't be shared across threads, so use our own
+        db_manager = DatabaseManager(self.db_path)
+        
+        try:
+            analyzer = HistoryAnalyzer(db_manager)
+            summary, cpu_series, mem_series = analyzer.build_system_bundle(self.hours)
+            
+            self.signals.finished.emit({
+                'request_id': self.request_id,
+                'hours': self.hours,
+                'summary': summary,
+                'cpu_series': cpu_series,
+                'mem_series': mem_series
+            })
+        except Exception as e:
+            print(f"Error loading system history: {e}")
+        finally:
+            db_manager.close()
+
 
 class HistoryDialog(QDialog):
     """Dialog for displaying process and system history."""
@@ -32,15 +140,35 @@ class HistoryDialog(QDialog):
         super().__init__(parent)
         
         self.history_analyzer = history_analyzer
+        self._system_request_id = 0
+        self._system_request_key = None
+        self._system_cache = OrderedDict()
         self.setWindowTitle("Process History and Analysis")
         self.resize(1000, 700)
         
+        # Coalesce bursts of selector changes into a single reload
+        self._system_reload_timer = self._create_reload_timer(self._load_system_data)
+        self._process_reload_timer = self._create_reload_timer(self._load_process_data)
+        self._top_reload_timer = self._create_reload_timer(self._load_top_data)
+        
         # Set up the UI
         self._setup_ui()
         
         # Load initial data
         self._load_data()
     
+    def _create_reload_timer(self, slot):
+        """Create a single-shot timer that debounces calls to a reload slot.
+        
+        Args:
+            slot: Method to call once the selection has settled
+        """
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(RELOAD_DEBOUNCE_MS)
+        timer.timeout.connect(slot)
+        return timer
+    
     def _setup_ui(self):
         """Set up the user interface."""
         # Create main layout
@@ -174,7 +302,7 @@ class HistoryDialog(QDialog):
         self.period_combo = QComboBox()
         self.period_combo.addItems(["Last 6 Hours", "Last 24 Hours", "Last 3 Days", "Last 7 Days"])
         self.period_combo.setCurrentIndex(1)  # Default to 24 hours
-        self.period_combo.currentIndexChanged.connect(self._load_system_data)
+        self.period_combo.currentIndexChanged.connect(lambda: self._system_reload_timer.start())
         period_layout.addWidget(self.period_combo)
         period_layout.addStretch()
         
@@ -240,16 +368,16 @@ class HistoryDialog(QDialog):
         cpu_chart_label.setFont(QFont('Arial', 11, QFont.Weight.Bold))
         charts_layout.addWidget(cpu_chart_label)
         
-        self.cpu_chart_canvas = FigureCanvas(Figure(figsize=(8, 4)))
-        charts_layout.addWidget(self.cpu_chart_canvas)
+        self.cpu_chart = FastLineChart(color='#4287f5')
+        charts_layout.addWidget(self.cpu_chart)
         
         # Memory usage chart
         mem_chart_label = QLabel("Memory Usage Over Time")
         mem_chart_label.setFont(QFont('Arial', 11, QFont.Weight.Bold))
         charts_layout.addWidget(mem_chart_label)
         
-        self.mem_chart_canvas = FigureCanvas(Figure(figsize=(8, 4)))
-        charts_layout.addWidget(self.mem_chart_canvas)
+        self.mem_chart = FastLineChart(color='#f54242')
+        charts_layout.addWidget(self.mem_chart)
         
         layout.addLayout(charts_layout)
     
@@ -263,7 +391,7 @@ class HistoryDialog(QDialog):
         
         self.process_combo = QComboBox()
         self.process_combo.setMinimumWidth(200)
-        self.process_combo.currentIndexChanged.connect(self._load_process_data)
+        self.process_combo.currentIndexChanged.connect(lambda: self._process_reload_timer.start())
         selector_layout.addWidget(self.process_combo)
         
         selector_layout.addStretch()
@@ -274,14 +402,14 @@ class HistoryDialog(QDialog):
         self.process_period_combo = QComboBox()
         self.process_period_combo.addItems(["Last 6 Hours", "Last 24 Hours", "Last 3 Days", "Last 7 Days"])
         self.process_period_combo.setCurrentIndex(1)  # Default to 24 hours
-        self.process_period_combo.currentIndexChanged.connect(self._load_process_data)
+        self.process_period_combo.currentIndexChanged.connect(lambda: self._process_reload_timer.start())
         selector_layout.addWidget(self.process_period_combo)
         
         layout.addLayout(selector_layout)
         
         # Add process trend chart
-        self.process_chart_canvas = FigureCanvas(Figure(figsize=(8, 6)))
-        layout.addWidget(self.process_chart_canvas)
+        self.process_chart = FastLineChart(color='#4287f5', secondary_color='#f54242')
+        layout.addWidget(self.process_chart)
         
         # Add process stats
         stats_frame = QFrame()
@@ -337,7 +465,7 @@ class HistoryDialog(QDialog):
         self.top_count_combo = QComboBox()
         self.top_count_combo.addItems(["5", "10", "15", "20"])
         self.top_count_combo.setCurrentIndex(0)  # Default to 5
-        self.top_count_combo.currentIndexChanged.connect(self._load_top_data)
+        self.top_count_combo.currentIndexChanged.connect(lambda: self._top_reload_timer.start())
         controls_layout.addWidget(self.top_count_combo)
         
         controls_layout.addStretch()
@@ -345,8 +473,9 @@ class HistoryDialog(QDialog):
         layout.addLayout(controls_layout)
         
         # Add chart
-        self.top_chart_canvas = FigureCanvas(Figure(figsize=(8, 5)))
-        layout.addWidget(self.top_chart_canvas)
+        self.top_chart = ChartLabel(figsize=(8, 5))
+        self.top_ax = self.top_chart.figure.subplots()
+        layout.addWidget(self.top_chart, 1)
         
         # Add table
         table_label = QLabel("Top Processes by CPU Usage")
@@ -384,8 +513,51 @@ class HistoryDialog(QDialog):
         period_index = self.period_combo.currentIndex()
         hours = [6, 24, 72, 168][period_index]  # 6h, 24h, 3d, 7d
         
-        # Get system summary
-        summary = self.history_analyzer.get_system_summary(hours)
+        # Series have a fixed point count that FastLineChart scales to its width,
+        # so only a new sample (a new latest row id) invalidates a cache entry
+        latest_id = self.history_analyzer.db_manager.get_latest_system_id()
+        key = (hours, latest_id)
+        
+        # Supersede any load still in flight
+        self._system_request_id += 1
+        self._system_request_key = key
+        
+        if key in self._system_cache:
+            self._system_cache.move_to_end(key)
+            self._show_system_data(self._system_cache[key])
+            return
+        
+        # Load in the background; only the latest request is shown
+        worker = SystemHistoryWorker(
+            self.history_analyzer.db_manager.db_path,
+            self._system_request_id,
+            hours
+        )
+        worker.signals.finished.connect(self._on_system_data_loaded)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_system_data_loaded(self, result):
+        """Show system overview data produced by a background worker.
+        
+        Args:
+            result: Dictionary emitted by SystemHistoryWorker
+        """
+        if result['request_id'] != self._system_request_id:
+            return
+        
+        self._system_cache[self._system_request_key] = result
+        if len(self._system_cache) > SYSTEM_CACHE_SIZE:
+            self._system_cache.popitem(last=False)
+        
+        self._show_system_data(result)
+    
+    def _show_system_data(self, result):
+        """Update the system overview labels and charts.
+        
+        Args:
+            result: Dictionary emitted by SystemHistoryWorker
+        """
+        summary = result['summary']
         
         # Update summary labels
         self.cpu_avg_label.setText(f"Avg: {summary['cpu_avg']:.1f}%")
@@ -397,26 +569,24 @@ class HistoryDialog(QDialog):
         self.proc_avg_label.setText(f"Avg: {summary['processes_avg']}")
         self.data_points_label.setText(f"Data Points: {summary['data_points']}")
         
-        # Update CPU chart
-        cpu_fig = self.history_analyzer.generate_cpu_usage_chart(hours)
-        self.cpu_chart_canvas.figure = cpu_fig
-        self.cpu_chart_canvas.draw()
-        
-        # Update memory chart
-        mem_fig = self.history_analyzer.generate_memory_usage_chart(hours)
-        self.mem_chart_canvas.figure = mem_fig
-        self.mem_chart_canvas.draw()
+        # Update charts
+        hours = result['hours']
+        self.cpu_chart.set_data(*result['cpu_series'],
+                                title=f"CPU Usage Over the Last {hours} Hours",
+                                ylabel="CPU Usage (%)")
+        self.mem_chart.set_data(*result['mem_series'],
+                                title=f"Memory Usage Over the Last {hours} Hours",
+                                ylabel="Memory Usage (%)")
     
     def _load_process_list(self):
         """Load the list of processes for the combo box."""
         # Get top processes
-        df = self.history_analyzer.get_top_processes(20)
+        top = self.history_analyzer.get_top_processes(20)
         
         # Clear and populate combo box
         self.process_combo.clear()
-        if not df.empty:
-            for name in df['name']:
-                self.process_combo.addItem(name)
+        for name in top['name']:
+            self.process_combo.addItem(name)
     
     def _load_process_data(self):
         """Load data for the selected process."""
@@ -441,9 +611,12 @@ class HistoryDialog(QDialog):
         self.process_data_points_label.setText(f"Data Points: {analysis['data_points']}")
         
         # Update chart
-        fig = self.history_analyzer.generate_process_trend_chart(process_name)
-        self.process_chart_canvas.figure = fig
-        self.process_chart_canvas.draw()
+        cpu_series, mem_series = self.history_analyzer.get_process_trend_series(process_name)
+        self.process_chart.set_data(*cpu_series,
+                                    title=f"CPU and Memory Trends for {process_name}",
+                                    ylabel="CPU Usage (%)",
+                                    secondary=mem_series,
+                                    secondary_label="Memory Usage (MB)")
     
     def _load_top_data(self):
         """Load data for the top processes tab."""
@@ -451,28 +624,38 @@ class HistoryDialog(QDialog):
         count = int(self.top_count_combo.currentText())
         
         # Get top processes
-        df = self.history_analyzer.get_top_processes(count)
+        top = self.history_analyzer.get_top_processes(count)
         
         # Update chart
-        fig = self.history_analyzer.generate_top_processes_chart(count)
-        self.top_chart_canvas.figure = fig
-        self.top_chart_canvas.draw()
-        
-        # Update table
-        self.top_table.setRowCount(len(df))
-        
-        for row, (_, process) in enumerate(df.iterrows()):
-            # Name
-            self.top_table.setItem(row, 0, QTableWidgetItem(process['name']))
-            
-            # CPU %
-            self.top_table.setItem(row, 1, QTableWidgetItem(f"{process['avg_cpu']:.1f}"))
+        self.history_analyzer.generate_top_processes_chart(count, ax=self.top_ax, top=top)
+        self.top_chart.refresh()
+        
+        # Update table with repaints and per-item column resizing suspended
+        header = self.top_table.horizontalHeader()
+        sorting_enabled = self.top_table.isSortingEnabled()
+        self.top_table.setUpdatesEnabled(False)
+        self.top_table.setSortingEnabled(False)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        
+        try:
+            names = top['name'].tolist()
+            self.top_table.setRowCount(len(names))
             
-            # Memory MB
-            self.top_table.setItem(row, 2, QTableWidgetItem(f"{process['avg_memory']:.1f}"))
+            # Format each column in one vectorized call rather than per cell
+            cpu_strs = np.char.mod('%.1f', top['avg_cpu']).tolist()
+            mem_strs = np.char.mod('%.1f', top['avg_memory']).tolist()
+            count_strs = top['count'].astype(str).tolist()
             
-            # Count
-            self.top_table.setItem(row, 3, QTableWidgetItem(str(int(process['count']))))
+            for row in range(len(names)):
+                self.top_table.setItem(row, 0, QTableWidgetItem(names[row]))
+                self.top_table.setItem(row, 1, QTableWidgetItem(cpu_strs[row]))
+                self.top_table.setItem(row, 2, QTableWidgetItem(mem_strs[row]))
+                self.top_table.setItem(row, 3, QTableWidgetItem(count_strs[row]))
+        finally:
+            header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+            header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+            self.top_table.setSortingEnabled(sorting_enabled)
+            self.top_table.setUpdatesEnabled(True)
     
     def closeEvent(self, event):
         """Handle dialog close event."""